@@ -5,13 +5,27 @@ FastAPI app exposing a simple /run endpoint that executes the LangGraph pipeline
 Includes /health for liveness checks.
 """
 from __future__ import annotations
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from pydantic import BaseModel
 from ..models import RunRequest
 from .deps import get_checkpointer, get_kv, get_graph
-from ..graph.graph import run_graph
+from ..graph.graph import arun_graph
 
-app = FastAPI(title="LangGraph Finance Research Agents", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build the graph, KV store and checkpointer once at startup and keep them on
+    `app.state`, so requests don't pay per-call dependency resolution.
+    """
+    app.state.cp = get_checkpointer()
+    app.state.kv = get_kv()
+    app.state.graph = get_graph()
+    yield
+
+
+app = FastAPI(title="LangGraph Finance Research Agents", version="1.0.0", lifespan=lifespan)
 
 class RunResponse(BaseModel):
     """Response model for /run endpoint."""
@@ -27,17 +41,14 @@ def health():
     return {"status": "ok"}
 
 @app.post("/run", response_model=RunResponse)
-def run(
-    req: RunRequest,
-    checkpointer = Depends(get_checkpointer),  # kept for health/side effects if needed
-    kv = Depends(get_kv),
-    graph = Depends(get_graph),
-):
+async def run(req: RunRequest, request: Request):
     """
     Execute a single run through the LangGraph pipeline.
     The request provides a session_id (for continuity) and a question/task.
+    Session I/O is async and the graph runs off the event loop (see `arun_graph`).
     """
-    result = run_graph(graph, req.session_id, req.question, kv)
+    state = request.app.state
+    result = await arun_graph(state.graph, req.session_id, req.question, state.kv)
     return RunResponse(
         **{k: result[k] for k in ["session_id", "output", "guardrail_flags", "steps", "last_tool_result"]}
     )
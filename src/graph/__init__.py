@@ -1,3 +1,3 @@
 # Re-export common graph utilities for convenience
-from .graph import build_graph, run_graph
+from .graph import build_graph, run_graph, arun_graph
 from .memory import make_checkpointer
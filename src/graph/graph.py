@@ -4,7 +4,7 @@ graph.py
 LangGraph wiring. Defines the state machine and node transitions.
 
 Key fixes in this version:
-- Robust handling of the graph's return type (dict OR Pydantic model).
+- Robust handling of the graph's return type (dict, dataclass OR Pydantic model).
 - History is stored as `Message` objects, but node steps normalize to dicts
   before calling LLM helpers.
 - Safe extraction of fields from the final result regardless of type.
@@ -15,18 +15,32 @@ START -> research -> (tool loop/research) -> review -> guard -> END
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
 from typing import Dict, Any, List, Tuple
 
+import anyio.to_thread
 from langgraph.graph import StateGraph, START, END
+from pydantic import BaseModel
 
 from .guardrails import validate_output
 from ..models import GraphState, Message
-from .nodes import researcher_step, reviewer_step, call_tool
+from .nodes import researcher_step, reviewer_step, call_tool, HISTORY_TURNS
 from .memory import SessionKVStore
 from ..config import settings
 
 
 MAX_STEPS = 3
+MAX_HISTORY = 32     # messages kept in state; bounds checkpoint size per transition
+MAX_TOOL_QUEUE = 8   # pending tool calls accepted from a single research step
+MAX_TOOL_WORKERS = 4 # threads used to run a batch of tool calls concurrently
+RESPONSE_HISTORY = 6 # trailing history messages returned to API callers
+
+# Read once at import; settings are loaded from the environment at startup only.
+_API_KEY = settings.openai_api_key
+
+logger = logging.getLogger(__name__)
 
 
 # --------------------------------------------------------------------------------------
@@ -34,56 +48,59 @@ MAX_STEPS = 3
 # --------------------------------------------------------------------------------------
 def _append(state: GraphState, role: str, content: str) -> None:
     """
-    Append a message to the state's history as a `Message` object.
+    Append a message to the state's history as a `Message` object and record
+    its index so the latest message per role can be looked up in O(1).
+    History is capped at MAX_HISTORY messages; the latest user message is pinned
+    at the front when it would be trimmed, and role indices are shifted to match.
     """
     state.history.append(Message(role=role, content=content))
+    state.last_by_role[role] = len(state.history) - 1
+
+    overflow = len(state.history) - MAX_HISTORY
+    if overflow > 0:
+        user_idx = state.last_by_role.get("user")
+        pinned = user_idx is not None and user_idx < overflow
+        # Drop one extra message to make room for the pinned user message
+        cut = overflow + 1 if pinned else overflow
+        state.history[:cut] = [state.history[user_idx]] if pinned else []
+        # Surviving messages move down by `overflow` either way
+        state.last_by_role = {r: i - overflow for r, i in state.last_by_role.items() if i >= cut}
+        if pinned:
+            state.last_by_role["user"] = 0
 
 
 def _to_msg_dicts(history: List[Message]) -> List[Dict[str, Any]]:
     """
     Convert a list of Message objects to a list of plain dicts.
+    Reads fields directly rather than via `model_dump()` to skip serializer overhead.
     """
-    out: List[Dict[str, Any]] = []
-    for m in history:
-        try:
-            out.append(m.model_dump())
-        except Exception:
-            out.append({"role": getattr(m, "role", ""), "content": getattr(m, "content", "")})
-    return out
+    return [{"role": m.role, "content": m.content, "meta": m.meta} for m in history]
 
 
-def _get_last_by_role(history: List[Message], role: str) -> str:
+def _get_last_by_role(state: GraphState, role: str) -> str:
     """
     Find the content of the most recent message with the given role.
     """
-    for m in reversed(history):
-        if getattr(m, "role", None) == role:
-            return getattr(m, "content", "") or ""
-    return ""
+    idx = state.last_by_role.get(role)
+    return state.history[idx].content if idx is not None else ""
 
 
 def _result_to_dict(result: Any) -> Dict[str, Any]:
     """
-    Normalize a LangGraph invoke result (which may be a Pydantic model or a dict)
+    Normalize a LangGraph invoke result (which may be a dataclass, a Pydantic model or a dict)
     into a plain dict for consistent field access.
     """
+    # Plain dict is what LangGraph returns in practice; check it first
+    if isinstance(result, dict):
+        return result
     if result is None:
         return {}
+    # Dataclass state (e.g. GraphState); slotted, so vars() below would fail
+    if is_dataclass(result) and not isinstance(result, type):
+        return {f.name: getattr(result, f.name) for f in fields(result)}
     # Pydantic v2 models
-    if hasattr(result, "model_dump"):
-        try:
-            return result.model_dump()
-        except Exception:
-            pass
-    # Pydantic v1 fallback
-    if hasattr(result, "dict"):
-        try:
-            return result.dict()
-        except Exception:
-            pass
-    # Already a dict?
-    if isinstance(result, dict):
-        return result
+    if isinstance(result, BaseModel):
+        return result.model_dump()
     # Last resort: try __dict__
     try:
         return dict(result)  # may raise
@@ -96,24 +113,15 @@ def _result_to_dict(result: Any) -> Dict[str, Any]:
 
 def _history_to_dicts(history_any: Any) -> List[Dict[str, Any]]:
     """
-    Convert an arbitrary `history` (list of Message objects or dicts) into list[dict].
+    Convert the tail of a `history` (Message objects or dicts) into list[dict].
+    Only the last RESPONSE_HISTORY entries are converted; anything else is skipped.
     """
     out: List[Dict[str, Any]] = []
-    for h in history_any or []:
-        if hasattr(h, "model_dump"):
-            try:
-                out.append(h.model_dump())
-                continue
-            except Exception:
-                pass
-        if isinstance(h, dict):
+    for h in (history_any or [])[-RESPONSE_HISTORY:]:
+        if isinstance(h, Message):
+            out.append({"role": h.role, "content": h.content})
+        elif isinstance(h, dict):
             out.append({"role": h.get("role", ""), "content": h.get("content", "")})
-            continue
-        # Best-effort conversion
-        try:
-            out.append(dict(h))
-        except Exception:
-            out.append({"role": getattr(h, "role", ""), "content": getattr(h, "content", "")})
     return out
 
 
@@ -124,37 +132,57 @@ def node_research(state: GraphState) -> GraphState:
     """
     Researcher step: produce a draft and optionally enqueue tool calls.
     """
-    question = _get_last_by_role(state.history, "user")
-    history_dicts = _to_msg_dicts(state.history)
+    question = _get_last_by_role(state, "user")
+    # Only the prompt window is converted; older turns never reach the LLM.
+    history_dicts = _to_msg_dicts(state.history[-HISTORY_TURNS:])
 
     draft, tool_calls = researcher_step(
-        settings.openai_api_key,
+        _API_KEY,
         question,
         history_dicts,
         state.last_tool_result,
     )
     _append(state, "assistant", draft)
+    if len(tool_calls) > MAX_TOOL_QUEUE:
+        logger.warning(
+            "Dropping %d tool calls beyond MAX_TOOL_QUEUE=%d",
+            len(tool_calls) - MAX_TOOL_QUEUE,
+            MAX_TOOL_QUEUE,
+        )
+        tool_calls = tool_calls[:MAX_TOOL_QUEUE]
     state.scratch["tool_queue"] = tool_calls
     state.steps += 1
     return state
 
 
-def node_tool(state: GraphState) -> GraphState:
+def _run_tool_call(call: Dict[str, Any]) -> Tuple[str | None, Dict[str, Any]]:
     """
-    Execute exactly one pending tool call from the queue (if any).
+    Execute a single queued tool call and return (tool_name, result).
+    """
+    name = call.get("tool") or call.get("tool_name")
+    args = call.get("args", {}) if isinstance(call.get("args"), dict) else {}
+    result = call_tool(name, **args) if name else {"error": "Invalid tool call schema."}
+    return name, result
+
+
+def node_tool_batch(state: GraphState) -> GraphState:
+    """
+    Drain the whole tool queue, running the (independent) calls concurrently.
+    Results are stored together under last_tool_result["batch"] and summarized in
+    a single tool message, so the Researcher sees them all in one follow-up step.
     """
     queue: List[Dict[str, Any]] = state.scratch.get("tool_queue", [])
     if not queue:
         return state
 
-    call = queue.pop(0)
-    name = call.get("tool") or call.get("tool_name")
-    args = call.get("args", {}) if isinstance(call.get("args"), dict) else {}
+    with ThreadPoolExecutor(max_workers=min(len(queue), MAX_TOOL_WORKERS)) as ex:
+        results = list(ex.map(_run_tool_call, queue))
 
-    result = call_tool(name, **args) if name else {"error": "Invalid tool call schema."}
-    state.last_tool_result = result
-    _append(state, "tool", f"{name}: {result}")
-    state.scratch["tool_queue"] = queue
+    state.last_tool_result = {
+        "batch": [{"tool": name, "result": result} for name, result in results]
+    }
+    _append(state, "tool", "\n".join(f"{name}: {result}" for name, result in results))
+    state.scratch["tool_queue"] = []
     return state
 
 
@@ -162,8 +190,8 @@ def node_review(state: GraphState) -> GraphState:
     """
     Reviewer step: critique and improve the latest assistant draft.
     """
-    last_assistant = _get_last_by_role(state.history, "assistant")
-    improved = reviewer_step(settings.openai_api_key, last_assistant or "Empty draft.")
+    last_assistant = _get_last_by_role(state, "assistant")
+    improved = reviewer_step(_API_KEY, last_assistant or "Empty draft.")
     _append(state, "assistant", improved)
     return state
 
@@ -172,7 +200,7 @@ def node_guard(state: GraphState) -> GraphState:
     """
     Guardrails step: validate output and add flags/disclaimer as needed.
     """
-    last_assistant = _get_last_by_role(state.history, "assistant")
+    last_assistant = _get_last_by_role(state, "assistant")
     safe_text, flags = validate_output(last_assistant)
     state.guardrail_flags.extend(flags)
     state.output = safe_text
@@ -186,8 +214,7 @@ def router(state: GraphState) -> str:
     - If we've just executed a tool (last_tool_result is set) and max steps not reached, go back to 'research'.
     - Otherwise proceed to 'review'.
     """
-    queue = state.scratch.get("tool_queue", [])
-    if queue:
+    if state.scratch.get("tool_queue"):
         return "tool"
     if state.steps < MAX_STEPS and state.last_tool_result is not None:
         return "research"
@@ -204,7 +231,7 @@ def build_graph(kv: SessionKVStore, checkpointer=None):
     g = StateGraph(GraphState)
 
     g.add_node("research", node_research)
-    g.add_node("tool", node_tool)
+    g.add_node("tool", node_tool_batch)
     g.add_node("review", node_review)
     g.add_node("guard", node_guard)
 
@@ -217,39 +244,63 @@ def build_graph(kv: SessionKVStore, checkpointer=None):
     return g.compile(checkpointer=checkpointer)
 
 
-def run_graph(app_graph, session_id: str, user_message: str, kv: SessionKVStore) -> Dict[str, Any]:
+def _invoke_turn(app_graph, session_id: str, user_message: str, prior: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Invoke the compiled graph for a single user turn and persist session scratch.
-
-    Returns a plain dict with keys:
-      session_id, output, guardrail_flags, steps, last_tool_result, history
+    Seed the state for one user turn, invoke the graph and normalize the result to a dict.
     """
-    # Restore per-session scratch memory
-    prior = kv.read(session_id)
-
     # Seed the state with a Message object for the user input
-    initial = GraphState(
-        session_id=session_id,
-        history=[Message(role="user", content=user_message)],
-        scratch=prior,
-    )
+    initial = GraphState(session_id=session_id, scratch=prior)
+    _append(initial, "user", user_message)
 
     # Invoke the graph; depending on LangGraph version, this may return a pydantic
     # model or a plain dict. Normalize to dict immediately.
     raw = app_graph.invoke(initial, config={"configurable": {"thread_id": session_id}})
-    state_dict = _result_to_dict(raw)
+    return _result_to_dict(raw)
 
-    # Persist updated scratch (handle both dict and object cases)
-    scratch = state_dict.get("scratch", {}) if isinstance(state_dict, dict) else {}
-    kv.write(session_id, scratch if isinstance(scratch, dict) else {})
 
-    # Prepare a compact response payload
-    out = {
+def _scratch_of(state_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the session scratch to persist (`_result_to_dict` guarantees a dict).
+    """
+    scratch = state_dict.get("scratch")
+    return scratch if isinstance(scratch, dict) else {}
+
+
+def _response_payload(session_id: str, state_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prepare a compact response payload from the final graph state.
+    """
+    return {
         "session_id": session_id,
         "output": state_dict.get("output"),
-        "guardrail_flags": state_dict.get("guardrail_flags", []) or [],
-        "steps": state_dict.get("steps", 0) or 0,
+        "guardrail_flags": state_dict.get("guardrail_flags") or [],
+        "steps": state_dict.get("steps") or 0,
         "last_tool_result": state_dict.get("last_tool_result"),
-        "history": _history_to_dicts(state_dict.get("history", []))[-6:],
+        "history": _history_to_dicts(state_dict.get("history")),
     }
-    return out
+
+
+def run_graph(app_graph, session_id: str, user_message: str, kv: SessionKVStore) -> Dict[str, Any]:
+    """
+    Invoke the compiled graph for a single user turn and persist session scratch.
+
+    Returns a plain dict with keys:
+      session_id, output, guardrail_flags, steps, last_tool_result, history
+    """
+    # Restore per-session scratch memory
+    prior = kv.read(session_id)
+    state_dict = _invoke_turn(app_graph, session_id, user_message, prior)
+    kv.write(session_id, _scratch_of(state_dict))
+    return _response_payload(session_id, state_dict)
+
+
+async def arun_graph(app_graph, session_id: str, user_message: str, kv: SessionKVStore) -> Dict[str, Any]:
+    """
+    Async variant of `run_graph` for the API: session I/O is awaited so it overlaps
+    with other requests. The graph itself is invoked in a worker thread because the
+    SQLite checkpointer is synchronous and does not implement LangGraph's async API.
+    """
+    prior = await kv.aread(session_id)
+    state_dict = await anyio.to_thread.run_sync(_invoke_turn, app_graph, session_id, user_message, prior)
+    await kv.awrite(session_id, _scratch_of(state_dict))
+    return _response_payload(session_id, state_dict)
@@ -15,10 +15,9 @@ DISCLAIMER = (
 )
 
 def validate_output(text: str) -> Tuple[str, List[str]]:
-    flags: List[str] = []
-    for bad in DISALLOWED:
-        if bad.lower() in text.lower():
-            flags.append(f"disallowed_phrase:{bad}")
-    if "not financial advice" not in text.lower():
+    # Lowercase once and reuse for every substring check
+    low = text.lower()
+    flags: List[str] = [f"disallowed_phrase:{bad}" for bad in DISALLOWED if bad.lower() in low]
+    if "not financial advice" not in low:
         text = text.rstrip() + "\n\n" + DISCLAIMER
     return text, flags
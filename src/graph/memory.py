@@ -14,9 +14,14 @@ from __future__ import annotations
 
 import atexit
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
+import anyio
+import anyio.to_thread
+
 # Optional SQLite saver
 _HAS_SQLITE = False
 SqliteSaver = None  # type: ignore[attr-defined]
@@ -29,6 +34,18 @@ try:
 except Exception:
     pass
 
+# Optional fast JSON codec (stdlib json is used when orjson isn't installed)
+_HAS_ORJSON = False
+orjson = None  # type: ignore[assignment]
+
+try:
+    # pip install orjson
+    import orjson as _orjson  # type: ignore
+    orjson = _orjson
+    _HAS_ORJSON = True
+except Exception:
+    pass
+
 # Always available fallback
 try:
     from langgraph.checkpoint.memory import MemorySaver
@@ -90,23 +107,98 @@ class SessionKVStore:
     Minimal session-scoped KV store (JSON-backed) to persist long-term nuggets
     (e.g., user's preferences or prior conclusions). Not required by LangGraph,
     but useful for continuity beyond the checkpoint lifetime.
+
+    The last payload per session is kept in memory, so back-to-back turns of the
+    same session read from RAM instead of disk. This assumes a single writer
+    process per `persist_dir`.
     """
     def __init__(self, persist_dir: str) -> None:
         self.root = Path(persist_dir)
         self.root.mkdir(parents=True, exist_ok=True)
+        # session_id -> last JSON payload read or written; serves reads and skips no-op writes
+        self._last: Dict[str, bytes] = {}
 
     def _path(self, session_id: str) -> Path:
         return self.root / f"{session_id}.json"
 
+    @staticmethod
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        if _HAS_ORJSON:
+            # OPT_NON_STR_KEYS matches stdlib json, which coerces non-str keys to strings
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _loads(raw: bytes) -> Any:
+        if _HAS_ORJSON:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    @staticmethod
+    def _atomic_write(p: Path, payload: bytes) -> None:
+        """
+        Write to a sibling temp file and rename it over the target, so readers never
+        observe a truncated file. No explicit fsync: durability is best-effort.
+        """
+        tmp = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp, p)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
     def read(self, session_id: str) -> Dict[str, Any]:
+        # Decode from the cached payload so each caller gets an independent object
+        cached = self._last.get(session_id)
+        if cached is not None:
+            return self._loads(cached)
         p = self._path(session_id)
         if not p.exists():
             return {}
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            data = self._loads(p.read_bytes())
         except Exception:
             return {}
+        self._last[session_id] = self._dumps(data)
+        return data
+
+    async def aread(self, session_id: str) -> Dict[str, Any]:
+        """
+        Async `read`: cache hits stay in memory, misses read the file without blocking the loop.
+        """
+        cached = self._last.get(session_id)
+        if cached is not None:
+            return self._loads(cached)
+        p = anyio.Path(self._path(session_id))
+        if not await p.exists():
+            return {}
+        try:
+            data = self._loads(await p.read_bytes())
+        except Exception:
+            return {}
+        self._last[session_id] = self._dumps(data)
+        return data
 
     def write(self, session_id: str, data: Dict[str, Any]) -> None:
-        p = self._path(session_id)
-        p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        payload = self._dumps(data)
+        if self._last.get(session_id) == payload:
+            return
+        self._atomic_write(self._path(session_id), payload)
+        self._last[session_id] = payload
+
+    async def awrite(self, session_id: str, data: Dict[str, Any]) -> None:
+        """
+        Async `write`: the atomic temp-file write runs in a worker thread.
+        """
+        payload = self._dumps(data)
+        if self._last.get(session_id) == payload:
+            return
+        await anyio.to_thread.run_sync(self._atomic_write, self._path(session_id), payload)
+        self._last[session_id] = payload
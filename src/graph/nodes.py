@@ -11,8 +11,8 @@ This module defines:
 Key design notes:
 - We import message classes from `langchain_core.messages` (compatible with LangChain >= 0.3).
 - We accept history as a list of dicts (role/content) for the LLM prompt. The graph itself
-  stores `Message` Pydantic objects; graph.py normalizes to dicts before calling us, and we
-  defensively normalize again here.
+  stores `Message` Pydantic objects; graph.py normalizes to dicts before calling us, so we
+  only re-normalize here when raw objects are passed in.
 - Optional offline/dev mode (`DEV_NO_LLM=true`) bypasses LLM calls so you can smoke-test the app
   without OpenAI credentials.
 """
@@ -21,9 +21,15 @@ from __future__ import annotations
 
 import os
 import re
-import json
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 
+try:
+    # Optional C-accelerated JSON parsing; stdlib json is a drop-in fallback.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from langchain_openai import ChatOpenAI
 # New import location in modern LangChain:
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
@@ -40,6 +46,27 @@ from .tools.critique import checklist
 # --------------------------------------------------------------------------------------
 DEV_NO_LLM = os.getenv("DEV_NO_LLM", "").strip().lower() in {"1", "true", "yes"}
 
+# Number of recent history turns included in the Researcher prompt.
+HISTORY_TURNS = 6
+
+# Extracts the JSON list following a "TOOL_CALLS:" label in the Researcher output.
+_TOOL_CALLS_RE = re.compile(r"TOOL_CALLS\s*:\s*(\[[\s\S]*?\])", re.IGNORECASE)
+
+
+# --------------------------------------------------------------------------------------
+# Constant prompt pieces, built once (message construction runs Pydantic validation)
+# --------------------------------------------------------------------------------------
+_SYS_RESEARCHER_MSG = SystemMessage(content=SYSTEM_RESEARCHER)
+
+_TOOL_HINT_SUFFIX = (
+    "If you need external data, propose tool calls as a JSON list labeled exactly:\n"
+    "TOOL_CALLS: [\n"
+    '  {"tool": "get_price", "args": {"symbol": "NVDA"}},\n'
+    '  {"tool": "search_news", "args": {"query": "NVIDIA earnings"}}\n'
+    "]\n"
+    "Otherwise, write your draft directly. Prefer bullets for findings."
+)
+
 
 # --------------------------------------------------------------------------------------
 # Tool registry & safe dispatcher
@@ -64,6 +91,17 @@ def call_tool(tool_name: str, **kwargs) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+# --------------------------------------------------------------------------------------
+# LLM client cache
+# --------------------------------------------------------------------------------------
+@lru_cache(maxsize=4)
+def _get_llm(api_key: str, model: str = "gpt-4o-mini", temperature: float = 0.2) -> ChatOpenAI:
+    """
+    Return a shared ChatOpenAI client so its HTTP connection pool is reused across turns.
+    """
+    return ChatOpenAI(model=model, temperature=temperature, api_key=api_key)
+
+
 # --------------------------------------------------------------------------------------
 # Offline stubs (used when DEV_NO_LLM is true or OPENAI key is missing)
 # --------------------------------------------------------------------------------------
@@ -111,7 +149,7 @@ def researcher_step(
     history : list
         Recent conversation history. Expected shape: list of dicts with keys:
         {"role": "user"|"assistant"|"system"|"tool", "content": str}
-        We defensively normalize input in case Pydantic Message objects slip through.
+        Pydantic Message objects are normalized only if they are passed in directly.
     last_obs : dict | None
         Most recent tool result (if any), appended as context to the prompt.
 
@@ -124,31 +162,36 @@ def researcher_step(
             Parsed list of proposed tool calls if 'TOOL_CALLS: [...]' is found; else [].
             Each item should look like {"tool": "get_price", "args": {"symbol": "NVDA"}}
     """
-    # --- Normalize history to list[dict] defensively ---
-    norm_history: List[Dict[str, Any]] = []
-    for h in (history or []):
-        try:
-            if hasattr(h, "model_dump"):
-                norm_history.append(h.model_dump())
-            elif isinstance(h, dict):
-                norm_history.append({"role": h.get("role", ""), "content": h.get("content", "")})
-            else:
-                # Best-effort conversion
-                norm_history.append(dict(h))  # may raise; caught by outer try
-        except Exception:
-            # Ignore malformed history entries
-            continue
+    # --- Normalize history to list[dict] ---
+    # graph.py already passes list[dict]; only re-normalize when raw objects slip through.
+    # Only the last few turns reach the prompt, so slice before doing any work.
+    tail = history[-HISTORY_TURNS:] if isinstance(history, list) else []
+    norm_history: List[Dict[str, Any]] = tail
+    if tail and hasattr(tail[0], "model_dump"):
+        norm_history = []
+        for h in tail:
+            try:
+                if hasattr(h, "model_dump"):
+                    norm_history.append({"role": h.role, "content": h.content, "meta": h.meta})
+                elif isinstance(h, dict):
+                    norm_history.append({"role": h.get("role", ""), "content": h.get("content", "")})
+                else:
+                    # Best-effort conversion
+                    norm_history.append(dict(h))  # may raise; caught by outer try
+            except Exception:
+                # Ignore malformed history entries
+                continue
 
     # --- Offline/dev path (no LLM) ---
     if DEV_NO_LLM or not api_key:
         return _offline_stub_research(question, last_obs), []
 
     # --- Online path (LLM) ---
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2, api_key=api_key)
+    llm = _get_llm(api_key)
 
-    msgs: List[Any] = [SystemMessage(content=SYSTEM_RESEARCHER)]
+    msgs: List[Any] = [_SYS_RESEARCHER_MSG]
     # Use the last few turns to keep prompt lean
-    for m in norm_history[-6:]:
+    for m in norm_history:
         role = (m.get("role") or "").strip().lower()
         content = m.get("content", "")
         if role == "user":
@@ -167,30 +210,18 @@ def researcher_step(
     if last_obs:
         msgs.append(HumanMessage(content=f"Recent tool observation: {last_obs}"))
 
-    msgs.append(
-        HumanMessage(
-            content=(
-                f"Task: {question}\n\n"
-                "If you need external data, propose tool calls as a JSON list labeled exactly:\n"
-                "TOOL_CALLS: [\n"
-                '  {"tool": "get_price", "args": {"symbol": "NVDA"}},\n'
-                '  {"tool": "search_news", "args": {"query": "NVIDIA earnings"}}\n'
-                "]\n"
-                "Otherwise, write your draft directly. Prefer bullets for findings."
-            )
-        )
-    )
+    msgs.append(HumanMessage(content=f"Task: {question}\n\n{_TOOL_HINT_SUFFIX}"))
 
     out = llm.invoke(msgs).content
     tool_calls: List[Dict[str, Any]] = []
 
     # --- Extract TOOL_CALLS JSON block if present ---
-    m = re.search(r"TOOL_CALLS\s*:\s*(\[[\s\S]*?\])", out, re.IGNORECASE)
+    m = _TOOL_CALLS_RE.search(out)
     if m:
         try:
             # Be resilient to trailing commas / minor JSON issues
             block = m.group(1)
-            tool_calls = json.loads(block)
+            tool_calls = _json_loads(block)
             # Normalize items to {tool, args}
             cleaned: List[Dict[str, Any]] = []
             for item in tool_calls:
@@ -222,7 +253,7 @@ def reviewer_step(api_key: str, draft: str) -> str:
     if DEV_NO_LLM or not api_key:
         return _offline_stub_review(draft)
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2, api_key=api_key)
+    llm = _get_llm(api_key)
     notes = checklist(draft)
     checklist_text = "- " + "\n- ".join(notes) if notes else "- No additional notes."
     prompt = (
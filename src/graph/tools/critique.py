@@ -4,17 +4,18 @@ tools/critique.py
 Self-critique helper utilities for the Reviewer agent.
 """
 from __future__ import annotations
-from typing import List
+from typing import List, Tuple
+
+# (needle, note) pairs, checked in order against a single lowercased copy of the draft.
+_CHECKS: Tuple[Tuple[str, str], ...] = (
+    ("risks", "Add a 'Risks' section with 2-4 bullets."),
+    ("sources", "Add a 'Sources' line with at least 2 citations or 'N/A'."),
+    ("catalyst", "Mention near-term catalysts (earnings, product launches)."),
+)
 
 def checklist(text: str) -> List[str]:
     """
     Returns a list of concrete critique notes to improve the draft.
     """
-    notes: List[str] = []
-    if "risks" not in text.lower():
-        notes.append("Add a 'Risks' section with 2-4 bullets.")
-    if "sources" not in text.lower():
-        notes.append("Add a 'Sources' line with at least 2 citations or 'N/A'.")
-    if "catalyst" not in text.lower():
-        notes.append("Mention near-term catalysts (earnings, product launches).")
-    return notes
+    low = text.lower()
+    return [note for needle, note in _CHECKS if needle not in low]
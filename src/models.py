@@ -1,9 +1,10 @@
 """
 models.py
 ---------
-Pydantic models used by the API layer and LangGraph state.
+Pydantic models used by the API layer, plus the LangGraph state container.
 """
 from __future__ import annotations
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
@@ -20,11 +21,17 @@ class Message(BaseModel):
     content: str
     meta: Dict[str, Any] = Field(default_factory=dict)
 
-class GraphState(BaseModel):
+@dataclass(slots=True)
+class GraphState:
+    """
+    Graph state passed between nodes. A plain slotted dataclass rather than a
+    Pydantic model, so edge traversals don't pay for re-validation.
+    """
     session_id: str
-    history: List[Message] = Field(default_factory=list)
-    scratch: Dict[str, Any] = Field(default_factory=dict)
+    history: List[Message] = field(default_factory=list)
+    last_by_role: Dict[str, int] = field(default_factory=dict)  # role -> index of latest message in history
+    scratch: Dict[str, Any] = field(default_factory=dict)
     last_tool_result: Optional[Dict[str, Any]] = None
     output: Optional[str] = None
-    guardrail_flags: List[str] = Field(default_factory=list)
+    guardrail_flags: List[str] = field(default_factory=list)
     steps: int = 0
@@ -0,0 +1,43 @@
+from src.graph.graph import MAX_HISTORY, _append, _get_last_by_role
+from src.models import GraphState
+
+
+def test_append_tracks_last_index_per_role():
+    state = GraphState(session_id="s")
+    _append(state, "user", "q")
+    _append(state, "assistant", "a1")
+    _append(state, "tool", "t1")
+    _append(state, "assistant", "a2")
+    assert state.last_by_role == {"user": 0, "assistant": 3, "tool": 2}
+    assert _get_last_by_role(state, "assistant") == "a2"
+    assert _get_last_by_role(state, "missing") == ""
+
+
+def test_trim_keeps_user_message_pinned():
+    state = GraphState(session_id="s")
+    _append(state, "user", "question")
+    for i in range(MAX_HISTORY + 10):
+        _append(state, "tool" if i % 2 else "assistant", f"m{i}")
+
+    assert len(state.history) == MAX_HISTORY
+    assert state.history[0].role == "user"
+    assert _get_last_by_role(state, "user") == "question"
+    assert _get_last_by_role(state, "assistant") == f"m{MAX_HISTORY + 8}"
+    assert _get_last_by_role(state, "tool") == f"m{MAX_HISTORY + 9}"
+    # Every cached index points at a message of that role
+    for role, idx in state.last_by_role.items():
+        assert state.history[idx].role == role
+
+
+def test_trim_shifts_indices_when_user_is_recent():
+    state = GraphState(session_id="s")
+    for i in range(MAX_HISTORY):
+        _append(state, "assistant", f"a{i}")
+    _append(state, "user", "late question")
+    _append(state, "tool", "t")
+
+    assert len(state.history) == MAX_HISTORY
+    assert state.history[0].content == "a2"
+    assert _get_last_by_role(state, "user") == "late question"
+    assert _get_last_by_role(state, "assistant") == f"a{MAX_HISTORY - 1}"
+    assert _get_last_by_role(state, "tool") == "t"
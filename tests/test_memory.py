@@ -0,0 +1,31 @@
+import anyio
+
+from src.graph.memory import SessionKVStore
+
+
+def test_awrite_then_aread_roundtrip(tmp_path):
+    kv = SessionKVStore(str(tmp_path))
+
+    async def scenario():
+        await kv.awrite("s1", {"tool_queue": [{"tool": "get_price", "args": {"symbol": "NVDA"}}]})
+        return await kv.aread("s1")
+
+    data = anyio.run(scenario)
+    assert data == {"tool_queue": [{"tool": "get_price", "args": {"symbol": "NVDA"}}]}
+    # Written atomically: only the final file remains, no temp siblings
+    assert [p.name for p in tmp_path.iterdir()] == ["s1.json"]
+
+
+def test_aread_from_disk_in_fresh_store(tmp_path):
+    SessionKVStore(str(tmp_path)).write("s1", {"k": "v"})
+    fresh = SessionKVStore(str(tmp_path))
+    assert anyio.run(fresh.aread, "s1") == {"k": "v"}
+    assert anyio.run(fresh.aread, "missing") == {}
+
+
+def test_aread_returns_independent_objects(tmp_path):
+    kv = SessionKVStore(str(tmp_path))
+    anyio.run(kv.awrite, "s1", {"tool_queue": [1, 2]})
+    first = anyio.run(kv.aread, "s1")
+    first["tool_queue"].pop()
+    assert anyio.run(kv.aread, "s1") == {"tool_queue": [1, 2]}
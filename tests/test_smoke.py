@@ -1,2 +1,28 @@
 def test_placeholder():
     assert 1 + 1 == 2
+
+
+def test_run_endpoint_uses_lifespan_singletons(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.app import deps
+    from src.app.main import app
+    from src.config import settings
+    from src.graph import graph as graph_mod
+
+    # Offline path (no LLM) and isolated storage for this test
+    monkeypatch.setattr(graph_mod, "_API_KEY", "")
+    monkeypatch.setattr(settings, "persist_dir", str(tmp_path / "persist"))
+    monkeypatch.setattr(settings, "checkpoint_db", str(tmp_path / "checkpoints.sqlite"))
+    for fn in (deps.get_checkpointer, deps.get_kv, deps.get_graph):
+        fn.cache_clear()
+
+    with TestClient(app) as client:
+        assert app.state.graph is deps.get_graph()
+        assert app.state.kv is deps.get_kv()
+        resp = client.post("/run", json={"session_id": "smoke-1", "question": "Summarize NVDA."})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["session_id"] == "smoke-1"
+    assert "not financial advice" in body["output"]
+    assert (tmp_path / "persist" / "smoke-1.json").exists()